@@ -3,17 +3,25 @@ import os
 import sys
 import time
 import signal
+import asyncio
 import threading
 import re
 import logging
+
+try:
+    import regex  # Optional: faster matching engine than stdlib `re`
+except ImportError:
+    regex = None
 import requests
 import yaml
-import xml.etree.ElementTree as ET
-import keyboard  # ✅ Detects keypress for manual execution
+from requests.adapters import HTTPAdapter
+import aiohttp
+from lxml import etree
 from dotenv import load_dotenv
-from arrapi import RadarrAPI
 from pydantic import BaseModel
-from typing import List, Optional, Tuple, cast
+from typing import List, Optional, Set, Tuple
+from collections import deque
+from io import BytesIO
 import datetime
 
 # -----------------------------------------------------------------------------
@@ -65,6 +73,7 @@ class ConfigModel(BaseModel):
     quality_profile: str = "RARBG1080p265Pyhton"
     match_patterns: Optional[List[str]] = []
     not_match_patterns: Optional[List[str]] = []
+    ascii_match: bool = True
 
     @classmethod
     def load_from_file(cls, filename: str) -> "ConfigModel":
@@ -134,8 +143,17 @@ GUID_TRACK_FILE = os.path.join("config", "scanned_guids.txt")
 # Radarr API connection
 # -----------------------------------------------------------------------------
 
+RADARR_HEADERS = {"X-Api-Key": RADARR_API_KEY}
+
+# One pooled session for all synchronous HTTP: keep-alive amortizes the TLS
+# handshake across scheduled runs instead of reconnecting every cycle.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+
 try:
-    radarr = RadarrAPI(RADARR_URL, RADARR_API_KEY)
+    status_response = SESSION.get(f"{RADARR_URL}/api/v3/system/status", headers=RADARR_HEADERS, timeout=10)
+    status_response.raise_for_status()
     logging.info("✅ Connected to Radarr successfully!")
 except Exception as error:
     logging.error(f"❌ Failed to connect to Radarr: {error}")
@@ -148,19 +166,24 @@ except Exception as error:
 running = True
 manual_run_event = threading.Event()  # Used to signal a manual run
 
+CLEAR_LINE = "\r\x1b[2K"  # ANSI erase-line: 4 bytes instead of an 80-space rewrite
+
 # Cumulative counters for all executions since the script started
 total_movies_added = 0
 total_movies_exists = 0
 total_movies_invalid = 0
 total_movies_excluded = 0
 
-imdb_ids_to_add = []  # now storing tuples of (imdb_id, title)
-
 
 def signal_handler(_sig, _frame):
     logging.info("Received termination signal. Shutting down gracefully...")
     global running
     running = False
+    manual_run_event.set()  # Wake any countdown wait so shutdown isn't delayed
+
+
+def manual_run_handler(_sig, _frame):
+    manual_run_event.set()
 
 
 signal.signal(signal.SIGINT, signal_handler)
@@ -171,39 +194,99 @@ signal.signal(signal.SIGTERM, signal_handler)
 # Helper Functions
 # -----------------------------------------------------------------------------
 
-def load_regex_patterns(config: ConfigModel) -> Tuple[Optional[re.Pattern], Optional[re.Pattern]]:
+def load_regex_patterns(config: ConfigModel) -> Optional[re.Pattern]:
     try:
         match_patterns_list = config.match_patterns or []
         not_match_patterns_list = config.not_match_patterns or []
-        match_patterns = "|".join(match_patterns_list)
-        not_match_patterns = "|".join(not_match_patterns_list)
         logging.info("*******************************************************************************************")
         logging.info(
             f"🚀 Loaded {len(match_patterns_list)} match patterns and {len(not_match_patterns_list)} exclusion patterns."
         )
-        match_regex = re.compile(match_patterns, re.IGNORECASE) if match_patterns else None
-        not_match_regex = re.compile(not_match_patterns, re.IGNORECASE) if not_match_patterns else None
-        return match_regex, not_match_regex
+        if not match_patterns_list and not not_match_patterns_list:
+            return None
+        # Fuse both pattern lists into one alternation so each title is
+        # scanned in a single pass. Empty sides get sentinels: "(?!)" never
+        # matches, "$" matches any title the exclusions let through.
+        not_match_patterns = "|".join(not_match_patterns_list) or "(?!)"
+        match_patterns = "|".join(match_patterns_list) or "$"
+        fused_pattern = f"(?P<bad>{not_match_patterns})|(?P<good>{match_patterns})"
+        # Prefer the third-party `regex` engine when installed: it avoids the
+        # worst of stdlib re's backtracking on alternation-heavy patterns.
+        # ASCII-only case-folding skips the Unicode folding tables; release
+        # titles are ASCII, and users can set ascii_match: false if not.
+        if regex is not None:
+            flags = regex.IGNORECASE | regex.VERSION1
+            if config.ascii_match:
+                flags |= regex.ASCII
+            return regex.compile(fused_pattern, flags)
+        flags = re.IGNORECASE
+        if config.ascii_match:
+            flags |= re.ASCII
+        return re.compile(fused_pattern, flags)
     except Exception as error2:
         logging.error(f"❌ Failed to compile regex patterns: {error2}")
         sys.exit(1)
 
 
-def filter_title(title: str, match_regex: Optional[re.Pattern], not_match_regex: Optional[re.Pattern]) -> bool:
+# Compile the fused regex once at startup; config_model never changes at
+# runtime, so there is no need to recompile it on every execution cycle.
+FILTER_REGEX = load_regex_patterns(config_model)
+
+
+def filter_title(title: str, filter_regex: Optional[re.Pattern]) -> bool:
     if not title:
         return False
-    if match_regex and not match_regex.search(title):
-        return False
-    if not_match_regex and not_match_regex.search(title):
-        return False
-    return True
+    if filter_regex is None:
+        return True
+    matched = False
+    for match in filter_regex.finditer(title):
+        if match.lastgroup == "bad":
+            return False
+        matched = True
+    return matched
+
+
+def load_scanned_guids() -> Tuple[deque, Set[str], int]:
+    """
+    Loads tracked GUIDs into a recency deque plus a shadow set for O(1)
+    membership checks. Also returns the on-disk line count so the caller can
+    decide when the append-only file needs compacting.
+    """
+    scanned_guids: deque = deque(maxlen=MAX_STORED_GUIDS)
+    file_lines = 0
+    if os.path.exists(GUID_TRACK_FILE):
+        with open(GUID_TRACK_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                file_lines += 1
+                guid = line.strip()
+                if guid:
+                    scanned_guids.append(guid)
+    return scanned_guids, set(scanned_guids), file_lines
+
+
+def save_scanned_guids(scanned_guids: deque, new_guids: List[str], file_lines: int) -> None:
+    """
+    Appends this run's GUIDs to the tracking file; rewrites it from the deque
+    only once the file has grown past twice the retention limit.
+    """
+    if not new_guids:
+        return
+    if file_lines + len(new_guids) > 2 * MAX_STORED_GUIDS:
+        # Compact: keep only the newest MAX_STORED_GUIDS entries on disk.
+        with open(GUID_TRACK_FILE, "w", encoding="utf-8") as f:
+            for guid in scanned_guids:
+                f.write(guid + "\n")
+    else:
+        with open(GUID_TRACK_FILE, "a", encoding="utf-8") as f:
+            for guid in new_guids:
+                f.write(guid + "\n")
 
 
 def fetch_rss_feed(url: str, max_attempts: int = 5, initial_delay: int = 5) -> requests.Response:
     delay = initial_delay
     for attempt in range(1, max_attempts + 1):
         try:
-            response = requests.get(url, timeout=10)
+            response = SESSION.get(url, timeout=10)
             response.raise_for_status()
             return response
         except Exception as error3:
@@ -217,21 +300,50 @@ def fetch_rss_feed(url: str, max_attempts: int = 5, initial_delay: int = 5) -> r
     raise RuntimeError("Unreachable code reached in fetch_rss_feed")
 
 
-def add_movie_to_radarr(imdb_id: str, folder: str, quality: str, max_attempts: int = 3, initial_delay: int = 5) -> \
-        Tuple[List, List, List, List]:
+async def add_movie_to_radarr(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, imdb_id: str,
+                              folder: str, quality_profile_id: int, exclusions: set,
+                              max_attempts: int = 3, initial_delay: int = 5) -> Tuple[List, List, List, List]:
     delay = initial_delay
     for attempt in range(1, max_attempts + 1):
         try:
-            result = radarr.add_multiple_movies([imdb_id], folder, quality)
-            added, exists, invalid, excluded = cast(Tuple[List, List, List, List], result)
-            logging.info(
-                f"✅ IMDb ID {imdb_id} - Added: {added}, Exists: {exists}, Invalid: {invalid}, Excluded: {excluded}"
-            )
-            return added, exists, invalid, excluded
+            async with semaphore:
+                async with session.get(f"{RADARR_URL}/api/v3/movie/lookup/imdb",
+                                       params={"imdbId": imdb_id}) as lookup_response:
+                    if lookup_response.status == 404:
+                        movie = None
+                    else:
+                        lookup_response.raise_for_status()
+                        movie = await lookup_response.json()
+                if not movie or not movie.get("tmdbId"):
+                    logging.info(f"✅ IMDb ID {imdb_id} - Added: [], Exists: [], Invalid: ['{imdb_id}'], Excluded: []")
+                    return [], [], [imdb_id], []
+                if movie["tmdbId"] in exclusions:
+                    logging.info(f"✅ IMDb ID {imdb_id} - Added: [], Exists: [], Invalid: [], Excluded: ['{imdb_id}']")
+                    return [], [], [], [imdb_id]
+                movie.update({
+                    "qualityProfileId": quality_profile_id,
+                    "rootFolderPath": folder,
+                    "monitored": True,
+                    "minimumAvailability": "announced",
+                    "addOptions": {"searchForMovie": True},
+                })
+                async with session.post(f"{RADARR_URL}/api/v3/movie", json=movie) as add_response:
+                    if add_response.status == 400:
+                        body = await add_response.text()
+                        if "already" in body.lower():
+                            logging.info(
+                                f"✅ IMDb ID {imdb_id} - Added: [], Exists: ['{imdb_id}'], Invalid: [], Excluded: []"
+                            )
+                            return [], [imdb_id], [], []
+                        logging.info(f"✅ IMDb ID {imdb_id} - Added: [], Exists: [], Invalid: ['{imdb_id}'], Excluded: []")
+                        return [], [], [imdb_id], []
+                    add_response.raise_for_status()
+            logging.info(f"✅ IMDb ID {imdb_id} - Added: ['{imdb_id}'], Exists: [], Invalid: [], Excluded: []")
+            return [imdb_id], [], [], []
         except Exception as error4:
             logging.error(f"Attempt {attempt}: Error adding movie {imdb_id} to Radarr: {error4}")
             if attempt < max_attempts:
-                time.sleep(delay)
+                await asyncio.sleep(delay)
                 delay *= 2
             else:
                 logging.error(f"Max attempts reached for IMDb ID {imdb_id}. Skipping.")
@@ -239,78 +351,135 @@ def add_movie_to_radarr(imdb_id: str, folder: str, quality: str, max_attempts: i
     raise RuntimeError("Unreachable code reached in add_movie_to_radarr")
 
 
+async def add_movies_to_radarr(movies: List[Tuple[str, str]], folder: str, quality: str) -> List[Tuple[List, List, List, List]]:
+    """
+    Adds a batch of movies to Radarr concurrently over one pooled connection.
+    """
+    semaphore = asyncio.Semaphore(8)
+    connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector, headers=RADARR_HEADERS) as session:
+        async with session.get(f"{RADARR_URL}/api/v3/qualityprofile") as profiles_response:
+            profiles_response.raise_for_status()
+            profiles = await profiles_response.json()
+        quality_profile_id = next((profile["id"] for profile in profiles if profile["name"] == quality), None)
+        if quality_profile_id is None:
+            logging.error(f"❌ Quality profile '{quality}' not found in Radarr. Marking batch invalid.")
+            return [([], [], [imdb_id], []) for imdb_id, _ in movies]
+        # Respect Radarr's import exclusion list (keyed by TMDb ID).
+        async with session.get(f"{RADARR_URL}/api/v3/exclusions") as exclusions_response:
+            exclusions_response.raise_for_status()
+            exclusions = {exclusion["tmdbId"] for exclusion in await exclusions_response.json()}
+        return await asyncio.gather(
+            *[add_movie_to_radarr(session, semaphore, imdb_id, folder, quality_profile_id, exclusions)
+              for imdb_id, _ in movies]
+        )
+
+
 # -----------------------------------------------------------------------------
 # Functions for Script Execution
 # -----------------------------------------------------------------------------
 
+# Precompiled XPath callables shared by every run; compiling an XPath is
+# non-trivial C work that would otherwise repeat for every feed item.
+RSS_NS = {"nntmux": "https://nzbfinder.ws/rsshelp/"}
+TITLE_XPATH = etree.XPath("title/text()")
+GUID_XPATH = etree.XPath("guid/text()")
+IMDB_XPATH = etree.XPath("nntmux:attr[@name='imdb']/@value", namespaces=RSS_NS)
+
+
 def run_script():
     """
     Fetch the RSS feed, process movies, and send matching ones to Radarr.
     """
     global total_movies_added, total_movies_exists, total_movies_invalid, total_movies_excluded, running
-    match_regex, not_match_regex = load_regex_patterns(config_model)
     # Load GUIDs
     if DEBUG_MODE:
-        scanned_guids_set = set()
+        scanned_guids: deque = deque(maxlen=MAX_STORED_GUIDS)
+        scanned_guids_set: Set[str] = set()
+        guid_file_lines = 0
     else:
-        if os.path.exists(GUID_TRACK_FILE):
-            with open(GUID_TRACK_FILE, "r", encoding="utf-8") as f:
-                scanned_guids_set = set(f.read().splitlines())
-        else:
-            scanned_guids_set = set()
+        scanned_guids, scanned_guids_set, guid_file_lines = load_scanned_guids()
 
     try:
         response = fetch_rss_feed(RSS_FEED_URL)
-        root = ET.fromstring(response.content)
-        total_items = len(root.findall("./channel/item"))
-        existing_guids_count = sum(
-            1 for item in root.findall("./channel/item")
-            if item.find("guid") is not None and item.find("guid").text.split("/")[-1] in scanned_guids_set
-        )
-
-        logging.info(
-            f"✅ Successfully fetched and parsed RSS feed ({len(response.content)} bytes) with {total_items} items."
-        )
-        logging.info(f"🔄 {existing_guids_count} of {total_items} items were previously processed.")
     except Exception as error5:
-        logging.error(f"❌ Failed to fetch or parse RSS feed: {error5}. Skipping this run.")
+        logging.error(f"❌ Failed to fetch RSS feed: {error5}. Skipping this run.")
         return
 
-    ns = {"nntmux": "https://nzbfinder.ws/rsshelp/"}
-    new_guids = []
-
-    for item in root.findall("./channel/item"):
-        title_elem = item.find("title")
-        title = title_elem.text if title_elem is not None else ""
-        imdb_id_elem = item.find("nntmux:attr[@name='imdb']", ns)
-        imdb_id = imdb_id_elem.get("value") if imdb_id_elem is not None else None
-        guid_elem = item.find("guid")
-        guid_full = guid_elem.text if guid_elem is not None else None
-        guid = guid_full.split("/")[-1] if guid_full else None
-
-        if not guid:
-            continue
-        if not DEBUG_MODE and guid in scanned_guids_set:
-            continue
-
-        if filter_title(title, match_regex, not_match_regex):
-            logging.info(f"✅ MATCHED: {title}")
-            if imdb_id:
-                imdb_id = imdb_id if imdb_id.startswith("tt") else f"tt{imdb_id}"
-                # Ensure title is a proper string before appending
-                imdb_ids_to_add.append((imdb_id, title or "Unknown Title"))
-        else:
-            logging.info(f"❌ NOT MATCHED: {title}")
+    # Pre-size from the raw bytes so the list never has to grow mid-loop.
+    new_guids = [None] * response.content.count(b"<guid")
+    new_guid_count = 0
+    imdb_ids_to_add: List[Tuple[str, str]] = []  # tuples of (imdb_id, title)
+    total_items = 0
+    existing_guids_count = 0
 
-        new_guids.append(guid)
+    # Stream the feed item by item instead of materializing the whole DOM;
+    # memory stays flat no matter how high the feed's num parameter is set.
+    try:
+        for _, item in etree.iterparse(BytesIO(response.content), tag="item"):
+            try:
+                total_items += 1
+                title_texts = TITLE_XPATH(item)
+                title = title_texts[0] if title_texts else ""
+                imdb_values = IMDB_XPATH(item)
+                imdb_id = imdb_values[0] if imdb_values else None
+                guid_texts = GUID_XPATH(item)
+                guid_full = guid_texts[0] if guid_texts else None
+                guid = guid_full[guid_full.rfind("/") + 1:] if guid_full else None
+
+                if not guid:
+                    continue
+                if guid in scanned_guids_set:
+                    existing_guids_count += 1
+                    if not DEBUG_MODE:
+                        continue
+
+                if filter_title(title, FILTER_REGEX):
+                    logging.info(f"✅ MATCHED: {title}")
+                    if imdb_id:
+                        imdb_id = "tt" + imdb_id.removeprefix("tt")
+                        # Ensure title is a proper string before appending
+                        imdb_ids_to_add.append((imdb_id, title or "Unknown Title"))
+                else:
+                    logging.info(f"❌ NOT MATCHED: {title}")
+
+                # Dedupe within the run: a guid can repeat inside one feed.
+                if guid not in scanned_guids_set:
+                    scanned_guids_set.add(guid)
+                    new_guids[new_guid_count] = guid
+                    new_guid_count += 1
+            finally:
+                # Free the element and any already-processed siblings so the
+                # partial tree never holds more than the current item.
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+    except etree.XMLSyntaxError as error7:
+        logging.error(f"❌ Failed to parse RSS feed: {error7}. Skipping this run.")
+        return
+
+    del new_guids[new_guid_count:]  # Trim the unused pre-sized slots
+
+    logging.info(
+        f"✅ Successfully fetched and parsed RSS feed ({len(response.content)} bytes) with {total_items} items."
+    )
+    logging.info(f"🔄 {existing_guids_count} of {total_items} items were previously processed.")
 
     if imdb_ids_to_add:
-        logging.info(f"🎬 Processing {len(imdb_ids_to_add)} movies to add to Radarr...")
-        radarr.respect_list_exclusions_when_adding()  # Respect exclusion lists
+        # The same movie often appears as several releases in one feed;
+        # collapse to a single Radarr call per unique IMDb ID.
+        movies_to_add = list(dict(imdb_ids_to_add).items())
+        logging.info(f"🎬 Processing {len(movies_to_add)} movies to add to Radarr...")
+        try:
+            results = asyncio.run(add_movies_to_radarr(movies_to_add, MOVIE_FOLDER, QUALITY_PROFILE))
+        except Exception as error6:
+            logging.error(f"❌ Failed to add movies to Radarr: {error6}")
+            results = []
 
         total_added = total_exists = total_invalid = total_excluded = 0
-        for imdb_id, movie_title in imdb_ids_to_add:
-            added, exists, invalid, excluded = add_movie_to_radarr(imdb_id, MOVIE_FOLDER, QUALITY_PROFILE)
+        invalid_records = []
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        for (imdb_id, movie_title), (added, exists, invalid, excluded) in zip(movies_to_add, results):
             total_added += len(added)
             total_exists += len(exists)
             total_invalid += len(invalid)
@@ -321,22 +490,22 @@ def run_script():
             total_movies_invalid += len(invalid)
             total_movies_excluded += len(excluded)
 
-            # Log invalid movie responses to a separate file
+            # Collect invalid movie responses for a single batched write
             if invalid:
-                with open(INVALID_MOVIE_LOG_FILE, "a", encoding="utf-8") as f_invalid:
-                    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    f_invalid.write(f"{timestamp} - {movie_title} - {imdb_id}\n")
-                    logging.info(f"**** {movie_title} - {imdb_id} ****\n")
+                invalid_records.append(f"{timestamp} - {movie_title} - {imdb_id}\n")
+                logging.info(f"**** {movie_title} - {imdb_id} ****\n")
+
+        if invalid_records:
+            with open(INVALID_MOVIE_LOG_FILE, "a", encoding="utf-8") as f_invalid:
+                f_invalid.writelines(invalid_records)
 
         logging.info(
             f"📊 Summary for this run: Added: {total_added}, Exists: {total_exists}, Invalid: {total_invalid}, Excluded: {total_excluded}"
         )
 
     if not DEBUG_MODE:
-        final_guids = (new_guids + list(scanned_guids_set))[:MAX_STORED_GUIDS]
-        with open(GUID_TRACK_FILE, "w", encoding="utf-8") as f:
-            for guid in final_guids:
-                f.write(guid + "\n")
+        scanned_guids.extend(new_guids)  # maxlen evicts the oldest entries
+        save_scanned_guids(scanned_guids, new_guids, guid_file_lines)
 
     logging.info(
         f"📈 Cumulative Summary: Total Added: {total_movies_added}, Total Exists: {total_movies_exists}, "
@@ -344,43 +513,35 @@ def run_script():
     )
 
 
-def listen_for_manual_run():
-    """
-    Continuously listens for 'Ctrl + R' to signal a manual execution.
-    """
-    global running
-    while running:
-        keyboard.wait("ctrl+r")
-        manual_run_event.set()
-
-
 def run_countdown(total_seconds: int) -> bool:
     forced = os.environ.get("FORCE_INTERACTIVE", "0") == "1"
     interactive = forced or sys.stdout.isatty()
     if not interactive:
         next_run_time = datetime.datetime.now() + datetime.timedelta(seconds=total_seconds)
         logging.info(f"⏳ Next run scheduled at: {next_run_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    start_time = time.time()
+        # Nothing to redraw, so block in one wait instead of waking every
+        # second; the event fires on a manual trigger or shutdown signal.
+        return manual_run_event.wait(total_seconds)
+
+    deadline = time.monotonic() + total_seconds
+    last_rendered = None
     while running:
-        if manual_run_event.is_set():
-            return True
-        elapsed = time.time() - start_time
-        remaining = total_seconds - int(elapsed)
+        remaining = int(deadline - time.monotonic())
         if remaining <= 0:
             break
-        if interactive:
-            mins, secs = divmod(remaining, 60)
-            sys.stdout.write("\r" + " " * 80)
+        mins, secs = divmod(remaining, 60)
+        if (mins, secs) != last_rendered:
+            sys.stdout.write(f"\r⏳ Next run in {mins}m {secs}s (send SIGUSR1 to run now)")
             sys.stdout.flush()
-            sys.stdout.write(f"\r⏳ Next run in {mins}m {secs}s (Press 'Ctrl + R' to run now)")
+            last_rendered = (mins, secs)
+        # The event wait doubles as the tick sleep and returns True
+        # immediately when a manual run is triggered.
+        if manual_run_event.wait(1.0):
+            sys.stdout.write(CLEAR_LINE)
             sys.stdout.flush()
-        else:
-            # In non-interactive mode, you might choose to not print anything or log periodically.
-            pass
-        time.sleep(1)
-    if interactive:
-        sys.stdout.write("\r" + " " * 80 + "\r")
-        sys.stdout.flush()
+            return True
+    sys.stdout.write(CLEAR_LINE)
+    sys.stdout.flush()
     return False
 
 
@@ -389,12 +550,12 @@ def run_countdown(total_seconds: int) -> bool:
 # -----------------------------------------------------------------------------
 
 def test_filter_title():
-    test_regex_include = re.compile("movie", re.IGNORECASE)
-    test_regex_exclude = re.compile("bad", re.IGNORECASE)
-    assert filter_title("This is a Movie", test_regex_include, None) is True
-    assert filter_title("This is not a film", test_regex_include, None) is False
-    assert filter_title("This is a Movie but bad", test_regex_include, test_regex_exclude) is False
-    assert filter_title("", test_regex_include, test_regex_exclude) is False
+    test_regex_include = re.compile("(?P<bad>(?!))|(?P<good>movie)", re.IGNORECASE)
+    test_regex_fused = re.compile("(?P<bad>bad)|(?P<good>movie)", re.IGNORECASE)
+    assert filter_title("This is a Movie", test_regex_include) is True
+    assert filter_title("This is not a film", test_regex_include) is False
+    assert filter_title("This is a Movie but bad", test_regex_fused) is False
+    assert filter_title("", test_regex_fused) is False
     logging.info("✅ All filter_title tests passed.")
 
 
@@ -409,18 +570,25 @@ def run_unit_tests():
 
 def main():
     global running
-    if USE_KEYBOARD:
-        keyboard_thread = threading.Thread(target=listen_for_manual_run, daemon=True)
-        keyboard_thread.start()
+    if USE_KEYBOARD and hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, manual_run_handler)
+        logging.info("⌨️ Manual run trigger enabled: send SIGUSR1 (kill -USR1 <pid>) to run now")
     else:
-        logging.info("⌨️ Keyboard functionality is disabled (USE_KEYBOARD = False)")
+        logging.info("⌨️ Manual run trigger is disabled (USE_KEYBOARD = False)")
 
     logging.info("🚀 Running script immediately on startup...")
     run_script()
 
     while running:
+        # Coalesce manual triggers that arrived while a run was in progress;
+        # the run that just finished already covers them, so they must not
+        # queue another full cycle back to back.
+        manual_run_event.clear()
+        if not running:
+            break
+
         # Clear any leftover countdown text before starting a new countdown cycle.
-        sys.stdout.write("\r" + " " * 80 + "\r")
+        sys.stdout.write(CLEAR_LINE)
         sys.stdout.flush()
 
         triggered = run_countdown(EXECUTION_INTERVAL * 60)